@@ -1,16 +1,13 @@
 """Data update coordinator for Byte-Watt integration."""
 
 import asyncio
-import json
 import logging
 import socket
-import statistics
 import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional
 
-import voluptuous as vol
 from homeassistant.components.persistent_notification import async_create, async_dismiss
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_time_interval
@@ -19,7 +16,6 @@ from homeassistant.util import dt as dt_util
 
 from .bytewatt_client import ByteWattClient
 from .const import (
-    DOMAIN,
     CONF_HEARTBEAT_INTERVAL,
     CONF_MAX_DATA_AGE,
     CONF_STALE_CHECKS_THRESHOLD,
@@ -32,14 +28,12 @@ from .const import (
     DEFAULT_NOTIFY_ON_RECOVERY,
     DEFAULT_DIAGNOSTICS_MODE,
     DEFAULT_AUTO_RECONNECT_TIME,
-    MAX_DIAGNOSTIC_LOGS,
     RECENT_DATA_THRESHOLD,
     STALE_DATA_THRESHOLD,
     AUTO_RECONNECT_INTERVAL_HOURS,
     HTTPS_PORT,
 )
-from .utilities.circuit_breaker import CircuitBreaker, CircuitBreakerState
-from .utilities.connection_stats import ConnectionStatistics
+from .utilities.circuit_breaker import CircuitBreaker
 from .utilities.diagnostic_service import DiagnosticService
 
 _LOGGER = logging.getLogger(__name__)
@@ -48,6 +42,9 @@ _LOGGER = logging.getLogger(__name__)
 NOTIFICATION_RECOVERY = "bytewatt_recovery"
 NOTIFICATION_ERROR = "bytewatt_error"
 
+# Power-flow keys that all read zero when the API is in an error state
+ZERO_CHECK_METRICS = ("soc", "pgrid", "pload", "pbat", "ppv")
+
 
 class MidnightRolloverSkip(Exception):
     """Custom exception for intentional update skipping at midnight."""
@@ -163,15 +160,17 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
             # Check if circuit breaker allows execution
             if not self.circuit_breaker.can_execute():
                 _LOGGER.warning(
-                    f"Circuit breaker is {self.circuit_breaker.state.value}, using cached data"
-                )
-                self.diagnostic_service.log_diagnostic(
-                    "circuit_breaker_blocked",
-                    {
-                        "state": self.circuit_breaker.state.value,
-                        "stats": self.circuit_breaker.get_status_report(),
-                    },
+                    "Circuit breaker is %s, using cached data", self.circuit_breaker.state.value
                 )
+                # Only build the full status report when it will be recorded
+                if self.diagnostic_service.diagnostics_enabled:
+                    self.diagnostic_service.log_diagnostic(
+                        "circuit_breaker_blocked",
+                        {
+                            "state": self.circuit_breaker.state.value,
+                            "stats": self.circuit_breaker.get_status_report(),
+                        },
+                    )
 
                 # Use cached data if available
                 if self._last_battery_data:
@@ -191,8 +190,7 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
 
             # Heuristic to detect error state where API returns all zeros.
             if isinstance(battery_data, dict) and "soc" in battery_data:
-                key_metrics = ["soc", "pgrid", "pload", "pbat", "ppv"]
-                if all(battery_data.get(key, 0) == 0 for key in key_metrics):
+                if all(battery_data.get(key, 0) == 0 for key in ZERO_CHECK_METRICS):
                     _LOGGER.warning(
                         "Received data with key metrics at zero, which may indicate an API error. "
                         "Using cached data to prevent sensor reset."
@@ -214,7 +212,7 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
                     if self._serial_number != "All":
                         await self.client.get_feed_strategy()
             except Exception as ex:
-                _LOGGER.warning(f"Failed to fetch battery settings: {ex}")
+                _LOGGER.warning("Failed to fetch battery settings: %s", ex)
 
             # If we got valid battery data, update our cached version and last successful time
             if battery_data and "soc" in battery_data:
@@ -260,7 +258,7 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
                     _LOGGER.debug("API returned empty response.")
                 elif "soc" not in battery_data:
                     _LOGGER.debug(
-                        f"API returned invalid data, missing 'soc'. Keys: {list(battery_data.keys())}"
+                        "API returned invalid data, missing 'soc'. Keys: %s", battery_data.keys()
                     )
 
                 self.diagnostic_service.log_diagnostic(
@@ -283,10 +281,10 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
                 "last_updated": successful_update_time.isoformat(),
             }
 
-            _LOGGER.debug(f"Coordinator data refreshed with keys: {list(data.keys())}")
+            _LOGGER.debug("Coordinator data refreshed with keys: %s", data.keys())
             return data
         except MidnightRolloverSkip as err:
-            _LOGGER.info(f"Skipping data update: {err}")
+            _LOGGER.info("Skipping data update: %s", err)
             # Return cached data to avoid state changes
             return {
                 "battery": self._last_battery_data or {},
@@ -307,7 +305,7 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
 
             # If we have cached data, use it rather than failing
             if self._last_battery_data:
-                _LOGGER.error(f"Error communicating with API: {err}")
+                _LOGGER.error("Error communicating with API: %s", err)
                 _LOGGER.warning("Using cached data due to communication error")
 
                 # Update cache freshness status
@@ -396,7 +394,6 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
         # Immediately run a check if a time is configured
         if hasattr(self, "_auto_reconnect_time") and self._auto_reconnect_time:
             try:
-                current_time = dt_util.utcnow().time()
                 reconnect_time = dt_util.parse_time(self._auto_reconnect_time)
 
                 if reconnect_time:
@@ -453,17 +450,18 @@ class ByteWattDataUpdateCoordinator(DataUpdateCoordinator):
         current_time = dt_util.utcnow()
 
         # Log heartbeat check in diagnostics
-        self.diagnostic_service.log_diagnostic(
-            "heartbeat_check",
-            {
-                "timestamp": current_time.isoformat(),
-                "last_update": (
-                    self._last_successful_update.isoformat()
-                    if self._last_successful_update
-                    else "never"
-                ),
-            },
-        )
+        if self.diagnostic_service.diagnostics_enabled:
+            self.diagnostic_service.log_diagnostic(
+                "heartbeat_check",
+                {
+                    "timestamp": current_time.isoformat(),
+                    "last_update": (
+                        self._last_successful_update.isoformat()
+                        if self._last_successful_update
+                        else "never"
+                    ),
+                },
+            )
 
         # No successful update recorded yet
         if self._last_successful_update is None:
@@ -358,18 +358,21 @@ class ByteWattSensor(CoordinatorEntity, SensorEntity):
     def native_value(self):
         """Return the state of the sensor."""
         try:
-            if not self.coordinator.data or "battery" not in self.coordinator.data:
+            data = self.coordinator.data
+            if not data or "battery" not in data:
                 return None
 
-            battery_data = self.coordinator.data["battery"]
+            battery_data = data["battery"]
             value = battery_data.get(self._attribute)
 
             if value is None:
                 # First time encountering a missing attribute, log it at info level
                 # to help with troubleshooting new API responses
                 _LOGGER.debug(
-                    f"Attribute '{self._attribute}' not found in battery data for {self._attr_name}. "
-                    f"Available attributes: {list(battery_data.keys())}"
+                    "Attribute '%s' not found in battery data for %s. Available attributes: %s",
+                    self._attribute,
+                    self._attr_name,
+                    battery_data.keys(),
                 )
                 return None
 
@@ -383,7 +386,7 @@ class ByteWattSensor(CoordinatorEntity, SensorEntity):
                     return value
             return value
         except Exception as ex:
-            _LOGGER.error(f"Error getting sensor state for {self._attr_name}: {ex}")
+            _LOGGER.error("Error getting sensor state for %s: %s", self._attr_name, ex)
             return None
 
 
@@ -422,35 +425,37 @@ class ByteWattGridSensor(ByteWattSensor):
     def native_value(self):
         """Return the state of the sensor."""
         try:
-            if not self.coordinator.data or "battery" not in self.coordinator.data:
+            data = self.coordinator.data
+            if not data or "battery" not in data:
                 return None
 
             # In the new API, all data is in the battery object
             # Try to find matching attributes in the battery data
-            battery_data = self.coordinator.data["battery"]
+            battery_data = data["battery"]
 
             # Handle special case for energy metrics which may be in a different format
             if self._attribute in battery_data:
-                return battery_data.get(self._attribute)
+                return battery_data[self._attribute]
 
             # If data isn't available, we'll log it at debug level
             _LOGGER.debug(
-                f"Grid sensor {self._attribute} data not found in battery response"
+                "Grid sensor %s data not found in battery response", self._attribute
             )
             return None
         except Exception as ex:
-            _LOGGER.error(f"Error getting grid sensor state: {ex}")
+            _LOGGER.error("Error getting grid sensor state: %s", ex)
             return None
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         # Many grid sensors may not be available in the new API
-        if not self.coordinator.data or "battery" not in self.coordinator.data:
+        data = self.coordinator.data
+        if not data or "battery" not in data:
             return False
 
         # Check if this attribute exists in the data
-        return self._attribute in self.coordinator.data["battery"]
+        return self._attribute in data["battery"]
 
 
 class ByteWattLastUpdateSensor(ByteWattSensor):
@@ -491,7 +496,7 @@ class ByteWattLastUpdateSensor(ByteWattSensor):
                 return self.coordinator._last_successful_update
             return None
         except Exception as ex:
-            _LOGGER.error(f"Error getting last update time: {ex}")
+            _LOGGER.error("Error getting last update time: %s", ex)
             return None
 
     @property
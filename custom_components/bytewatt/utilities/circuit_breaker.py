@@ -44,7 +44,9 @@ class CircuitBreaker:
 
     def record_success(self, response_time: float):
         """Record a successful API call."""
-        self.stats.record_success(response_time)
+        # Read the clock once so the stats and any state change agree
+        now = datetime.now()
+        self.stats.record_success(response_time, now)
 
         # If we're in half-open state and got a success, close the circuit
         if self.state == CircuitBreakerState.HALF_OPEN:
@@ -52,11 +54,12 @@ class CircuitBreaker:
                 "Circuit breaker transitioning from HALF_OPEN to CLOSED after successful response"
             )
             self.state = CircuitBreakerState.CLOSED
-            self.last_state_change = datetime.now()
+            self.last_state_change = now
 
     def record_failure(self, error_type: str, error_message: str):
         """Record a failed API call."""
-        self.stats.record_failure(error_type, error_message)
+        now = datetime.now()
+        self.stats.record_failure(error_type, error_message, now)
 
         # If success rate drops below threshold, open the circuit
         if (
@@ -67,10 +70,12 @@ class CircuitBreaker:
 
             _LOGGER.warning(
                 "Circuit breaker transitioning from CLOSED to OPEN: "
-                f"success rate ({self.stats.success_rate:.2%}) below threshold ({self.failure_threshold:.2%})"
+                "success rate (%.2f%%) below threshold (%.2f%%)",
+                self.stats.success_rate * 100,
+                self.failure_threshold * 100,
             )
             self.state = CircuitBreakerState.OPEN
-            self.last_state_change = datetime.now()
+            self.last_state_change = now
 
         # If we're in half-open state and got a failure, back to open
         elif self.state == CircuitBreakerState.HALF_OPEN:
@@ -78,7 +83,7 @@ class CircuitBreaker:
                 "Circuit breaker transitioning from HALF_OPEN to OPEN after failed response"
             )
             self.state = CircuitBreakerState.OPEN
-            self.last_state_change = datetime.now()
+            self.last_state_change = now
 
     def check_state_transition(self):
         """Check if circuit breaker state should transition based on timeouts."""
@@ -91,7 +96,8 @@ class CircuitBreaker:
         ):
 
             _LOGGER.info(
-                f"Circuit breaker transitioning from OPEN to HALF_OPEN after {self.recovery_timeout}s timeout"
+                "Circuit breaker transitioning from OPEN to HALF_OPEN after %ss timeout",
+                self.recovery_timeout,
             )
             self.state = CircuitBreakerState.HALF_OPEN
             self.last_state_change = now
@@ -1,8 +1,9 @@
 """Connection statistics tracking for ByteWatt integration."""
 
 import logging
+from collections import Counter, deque
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Deque, Dict, Any, Optional, Tuple
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -13,48 +14,70 @@ class ConnectionStatistics:
     def __init__(self, window_size: int = 10):
         """Initialize connection statistics."""
         self.window_size = window_size
-        self.success_history: List[bool] = []
-        self.response_times: List[float] = []
-        self.error_types: Dict[str, int] = {}
+        # Bounded deques drop the oldest entry on append, keeping the window O(1)
+        self.success_history: Deque[bool] = deque(maxlen=window_size)
+        self.response_times: Deque[float] = deque(maxlen=window_size)
+        self._success_count = 0
+        self._response_time_sum = 0.0
+        # Only record_failure may change this, so the tracked leader stays in step
+        self._error_types: Counter[str] = Counter()
+        self._most_common_error: Optional[Tuple[str, int]] = None
         self.last_success_time: Optional[datetime] = None
         self.last_error_time: Optional[datetime] = None
         self.last_error_message: Optional[str] = None
 
     def reset(self):
         """Reset all statistics."""
-        self.success_history = []
-        self.response_times = []
-        self.error_types = {}
+        self.success_history.clear()
+        self.response_times.clear()
+        self._success_count = 0
+        self._response_time_sum = 0.0
+        self._error_types = Counter()
+        self._most_common_error = None
         self.last_success_time = None
         self.last_error_time = None
         self.last_error_message = None
 
-    def record_success(self, response_time: float):
+    def _append_result(self, success: bool):
+        """Append a call result, keeping the running success count in step."""
+        history = self.success_history
+        if not history.maxlen:
+            # A zero-size window stores nothing, so there is nothing to count
+            return
+        if len(history) == history.maxlen and history[0]:
+            # The oldest entry is about to be evicted by the append
+            self._success_count -= 1
+        history.append(success)
+        if success:
+            self._success_count += 1
+
+    def record_success(self, response_time: float, now: Optional[datetime] = None):
         """Record a successful API call."""
-        self.success_history.append(True)
-        self.response_times.append(response_time)
-        self.last_success_time = datetime.now()
-
-        # Trim history to window size
-        if len(self.success_history) > self.window_size:
-            self.success_history = self.success_history[-self.window_size :]
-            self.response_times = self.response_times[-self.window_size :]
-
-    def record_failure(self, error_type: str, error_message: str):
+        self._append_result(True)
+
+        # Keep a running total so the average does not rescan the window
+        times = self.response_times
+        if times.maxlen:
+            if len(times) == times.maxlen:
+                self._response_time_sum -= times[0]
+            times.append(response_time)
+            self._response_time_sum += response_time
+        self.last_success_time = now or datetime.now()
+
+    def record_failure(
+        self, error_type: str, error_message: str, now: Optional[datetime] = None
+    ):
         """Record a failed API call."""
-        self.success_history.append(False)
-        self.last_error_time = datetime.now()
+        self._append_result(False)
+        self.last_error_time = now or datetime.now()
         self.last_error_message = error_message
 
-        # Record error type
-        if error_type in self.error_types:
-            self.error_types[error_type] += 1
-        else:
-            self.error_types[error_type] = 1
-
-        # Trim history to window size
-        if len(self.success_history) > self.window_size:
-            self.success_history = self.success_history[-self.window_size :]
+        # Record error type; counts only grow until reset, so the leader
+        # can be tracked here instead of rescanning on every report
+        self._error_types[error_type] += 1
+        count = self._error_types[error_type]
+        if self._most_common_error is None or count > self._most_common_error[1]:
+            self._most_common_error = (error_type, count)
 
     @property
     def success_rate(self) -> float:
@@ -62,7 +85,7 @@ class ConnectionStatistics:
         if not self.success_history:
             return 1.0  # Default to 100% if no history
 
-        return sum(1 for x in self.success_history if x) / len(self.success_history)
+        return self._success_count / len(self.success_history)
 
     @property
     def avg_response_time(self) -> Optional[float]:
@@ -70,15 +93,12 @@ class ConnectionStatistics:
         if not self.response_times:
             return None
 
-        return sum(self.response_times) / len(self.response_times)
+        return self._response_time_sum / len(self.response_times)
 
     @property
     def most_common_error(self) -> Optional[Tuple[str, int]]:
         """Get the most common error type."""
-        if not self.error_types:
-            return None
-
-        return max(self.error_types.items(), key=lambda x: x[1])
+        return self._most_common_error
 
     def get_status_report(self) -> Dict[str, Any]:
         """Generate a status report of connection health."""
@@ -90,7 +110,7 @@ class ConnectionStatistics:
             "most_common_error": (
                 self.most_common_error[0] if self.most_common_error else "None"
             ),
-            "error_count": sum(self.error_types.values()),
+            "error_count": sum(self._error_types.values()),
             "last_success": (
                 self.last_success_time.isoformat()
                 if self.last_success_time
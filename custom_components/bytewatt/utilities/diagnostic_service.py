@@ -4,8 +4,9 @@ import json
 import logging
 import socket
 import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Deque, Dict, Any, List, Optional
 
 from ..const import HTTPS_PORT, MAX_DIAGNOSTIC_LOGS
 
@@ -18,8 +19,11 @@ class DiagnosticService:
     def __init__(self):
         """Initialize the diagnostic service."""
         self._diagnostics_enabled = False
-        self._diagnostic_logs: List[Dict[str, Any]] = []
         self._max_diagnostic_logs = MAX_DIAGNOSTIC_LOGS
+        # Bounded deque drops the oldest entry on append to prevent memory issues
+        self._diagnostic_logs: Deque[Dict[str, Any]] = deque(
+            maxlen=self._max_diagnostic_logs
+        )
 
     def enable_diagnostics(self):
         """Enable diagnostic logging."""
@@ -50,11 +54,7 @@ class DiagnosticService:
 
         self._diagnostic_logs.append(diagnostic_entry)
 
-        # Trim logs to prevent memory issues
-        if len(self._diagnostic_logs) > self._max_diagnostic_logs:
-            self._diagnostic_logs = self._diagnostic_logs[-self._max_diagnostic_logs :]
-
-        _LOGGER.debug(f"Diagnostic logged: {event_type}")
+        _LOGGER.debug("Diagnostic logged: %s", event_type)
 
     async def check_connectivity(self, base_url: str) -> Dict[str, Any]:
         """Check connectivity to the API server."""
@@ -106,7 +106,7 @@ class DiagnosticService:
 
     def get_diagnostic_logs(self) -> List[Dict[str, Any]]:
         """Get all diagnostic logs."""
-        return self._diagnostic_logs.copy()
+        return list(self._diagnostic_logs)
 
     @property
     def diagnostics_enabled(self) -> bool:
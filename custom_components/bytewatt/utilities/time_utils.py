@@ -5,6 +5,20 @@ import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# Accepted time formats, compiled once since every settings update sanitizes
+# up to eight time values
+TIME_FORMAT_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        # Standard time formats
+        r"^(\d{1,2}):(\d{1,2})$",  # HH:MM
+        r"^(\d{1,2}):(\d{1,2}):\d{1,2}$",  # HH:MM:SS
+        r"^(\d{1,2}):(\d{1,2}):\d{1,2}\.\d+$",  # HH:MM:SS.ms
+        # Home Assistant time picker formats
+        r"^(\d{1,2}):(\d{1,2}) [APap][Mm]$",  # HH:MM AM/PM
+    )
+)
+
 
 def sanitize_time_format(time_str):
     """
@@ -20,17 +34,8 @@ def sanitize_time_format(time_str):
         return None
 
     # Try different formats
-    time_formats = [
-        # Standard time formats
-        r"^(\d{1,2}):(\d{1,2})$",  # HH:MM
-        r"^(\d{1,2}):(\d{1,2}):\d{1,2}$",  # HH:MM:SS
-        r"^(\d{1,2}):(\d{1,2}):\d{1,2}\.\d+$",  # HH:MM:SS.ms
-        # Home Assistant time picker formats
-        r"^(\d{1,2}):(\d{1,2}) [APap][Mm]$",  # HH:MM AM/PM
-    ]
-
-    for pattern in time_formats:
-        match = re.match(pattern, time_str)
+    for pattern in TIME_FORMAT_PATTERNS:
+        match = pattern.match(time_str)
         if match:
             hours, minutes = match.groups()
             hours = int(hours)
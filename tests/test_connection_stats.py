@@ -0,0 +1,115 @@
+"""Unit tests for the connection statistics used by the circuit breaker."""
+
+import sys
+import os
+
+# Add parent directory to path to import local modules correctly
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from custom_components.bytewatt.utilities.connection_stats import ConnectionStatistics
+
+
+def test_most_common_error():
+    """Test that the most frequent error type is reported."""
+    stats = ConnectionStatistics()
+    assert stats.most_common_error is None
+
+    stats.record_failure("TimeoutError", "timed out")
+    stats.record_failure("ClientError", "refused")
+    stats.record_failure("TimeoutError", "timed out again")
+
+    assert stats.most_common_error == ("TimeoutError", 2)
+    assert stats.get_status_report()["error_count"] == 3
+
+    stats.record_failure("ClientError", "refused")
+    stats.record_failure("ClientError", "refused")
+
+    assert stats.most_common_error == ("ClientError", 3)
+
+
+def test_most_common_error_tie_keeps_first_to_reach_count():
+    """Test that on a tie the error that reached the count first is kept."""
+    stats = ConnectionStatistics()
+
+    for error_type in ("A", "B", "B", "A"):
+        stats.record_failure(error_type, "failed")
+
+    assert stats.most_common_error == ("B", 2)
+
+
+def test_reset_clears_error_types():
+    """Test that reset clears recorded error counts."""
+    stats = ConnectionStatistics()
+    stats.record_failure("TimeoutError", "timed out")
+
+    stats.reset()
+
+    assert stats.most_common_error is None
+    assert stats.get_status_report()["most_common_error"] == "None"
+
+
+def test_history_bounded_by_window():
+    """Test that only the most recent window of calls is kept."""
+    stats = ConnectionStatistics(window_size=3)
+
+    stats.record_failure("TimeoutError", "timed out")
+    for response_time in (1.0, 2.0, 3.0):
+        stats.record_success(response_time)
+
+    assert list(stats.success_history) == [True, True, True]
+    assert stats.success_rate == 1.0
+    assert stats.avg_response_time == 2.0
+
+    stats.record_failure("TimeoutError", "timed out")
+
+    assert len(stats.success_history) == 3
+    assert stats.success_rate == 2 / 3
+
+
+def test_success_rate_tracks_evictions():
+    """Test that the success rate follows the window as results roll off."""
+    stats = ConnectionStatistics(window_size=2)
+
+    stats.record_success(1.0)
+    stats.record_failure("TimeoutError", "timed out")
+    assert stats.success_rate == 0.5
+
+    stats.record_failure("TimeoutError", "timed out")
+    assert stats.success_rate == 0.0
+
+    stats.record_success(1.0)
+    stats.record_success(1.0)
+    assert stats.success_rate == 1.0
+
+    stats.reset()
+    assert stats.success_rate == 1.0
+
+
+def test_zero_window_records_without_history():
+    """Test that a zero-size window accepts results without keeping them."""
+    stats = ConnectionStatistics(window_size=0)
+
+    stats.record_success(1.0)
+    stats.record_failure("TimeoutError", "timed out")
+
+    assert len(stats.success_history) == 0
+    assert stats._success_count == 0
+    assert stats._response_time_sum == 0.0
+    assert stats.success_rate == 1.0
+    assert stats.avg_response_time is None
+
+
+def test_avg_response_time_tracks_evictions():
+    """Test that the average response time covers only the current window."""
+    stats = ConnectionStatistics(window_size=2)
+    assert stats.avg_response_time is None
+
+    stats.record_success(1.0)
+    stats.record_success(3.0)
+    assert stats.avg_response_time == 2.0
+
+    stats.record_success(5.0)
+    assert stats.avg_response_time == 4.0
+
+    stats.reset()
+    assert stats.avg_response_time is None